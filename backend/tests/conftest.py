@@ -219,12 +219,13 @@ def seeded_database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator
     initialize_database(db_path)
 
     monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
-    for module in ("backend.main", "backend.app.db"):
-        sys.modules.pop(module, None)
 
-    import backend.app.db  # noqa: F401
+    import backend.app.db as db_module
     import backend.main  # noqa: F401
 
+    # Repoint the already-imported app instead of re-importing it per test.
+    db_module.configure_engine(db_path)
+
     yield db_path
 
 
@@ -19,7 +19,9 @@ DATA_DIR = ROOT_DIR / "shared" / "data"
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
     with path.open(newline="", encoding="utf-8") as handle:
-        return [dict(row) for row in csv.DictReader(handle)]
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        return [dict(zip(header, row)) for row in reader if row]
 
 
 @pytest.fixture()
@@ -61,8 +63,9 @@ def test_free_agent_pool_matches_csvs(seeded_db: Path) -> None:
 def test_schedule_and_games_seeded(seeded_db: Path) -> None:
     schedule_rows = _read_csv(DATA_DIR / "schedule.csv")
     with sqlite3.connect(seeded_db) as connection:
-        schedule_count = connection.execute("SELECT COUNT(*) FROM schedule").fetchone()[0]
-        games_count = connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        schedule_count, games_count = connection.execute(
+            "SELECT (SELECT COUNT(*) FROM schedule), (SELECT COUNT(*) FROM games)"
+        ).fetchone()
     assert schedule_count == len(schedule_rows)
     expected_games = sum(1 for row in schedule_rows if int(row["home_game"]) == 1)
     assert games_count == expected_games
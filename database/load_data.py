@@ -3,7 +3,11 @@ from __future__ import annotations
 import os
 import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import cache
 from pathlib import Path
+from typing import Iterable
 
 BASE_DIR = Path(__file__).resolve().parent
 REPO_ROOT = BASE_DIR.parent
@@ -12,6 +16,9 @@ if str(REPO_ROOT) not in sys.path:
 
 from shared.constants.teams import TEAMS  # noqa: E402
 from shared.utils.parsers import (  # noqa: E402
+    iter_depth_charts,
+    iter_free_agents,
+    iter_ratings,
     parse_depth_charts,
     parse_free_agents,
     parse_ratings,
@@ -20,210 +27,407 @@ from shared.utils.parsers import (  # noqa: E402
 from shared.utils.rules import load_game_rules  # noqa: E402
 
 DATA_DIR = REPO_ROOT / "shared" / "data"
-DB_PATH = Path(os.environ.get("NFL_GM_DB_PATH", BASE_DIR / "nfl_gm_sim.db"))
+DEFAULT_DB_PATH = BASE_DIR / "nfl_gm_sim.db"
 SCHEMA_PATH = BASE_DIR / "schema.sql"
 CURRENT_YEAR = 2025
+_STRIP_DIGITS = str.maketrans("", "", "0123456789")
+# Conflict strategy used when copying each staged table onto the on-disk file.
+STAGED_TABLES = {
+    "teams": "IGNORE",
+    "players": "REPLACE",
+    "games": "IGNORE",
+    "draft_picks": "IGNORE",
+}
+# Staged tables whose surrogate ids are not copied: the on-disk file assigns
+# its own, and the UNIQUE keys (abbreviation, week/home/away) catch duplicates.
+DISK_ASSIGNED_IDS = frozenset({"teams", "games"})
+# Columns holding a teams.id, rewritten to the on-disk id of the same team.
+TEAM_ID_COLUMNS = {
+    "players": ("team_id",),
+    "games": ("home_team_id", "away_team_id"),
+    "draft_picks": ("team_id", "original_team_id"),
+}
+
+try:
+    _SCHEMA_SQL: str | None = SCHEMA_PATH.read_text()
+except FileNotFoundError:
+    _SCHEMA_SQL = None
+
+
+def resolve_db_path() -> Path:
+    """Return the target database, honouring ``NFL_GM_DB_PATH`` at call time."""
+
+    return Path(os.environ.get("NFL_GM_DB_PATH", DEFAULT_DB_PATH))
+
+
+@cache
+def _data_files() -> dict[str, Path]:
+    if not DATA_DIR.is_dir():
+        return {}
+    return {
+        path.name: path
+        for path in DATA_DIR.iterdir()
+        if path.suffix in (".csv", ".txt") and path.is_file()
+    }
 
 
 def _resolve_data_file(*names: str) -> Path:
+    data_files = _data_files()
     for name in names:
         for extension in (".csv", ".txt"):
-            candidate = DATA_DIR / f"{name}{extension}"
-            if candidate.exists():
+            candidate = data_files.get(f"{name}{extension}")
+            if candidate is not None:
                 return candidate
     # Fall back to the first name with the legacy .txt extension.
     return DATA_DIR / f"{names[0]}.txt"
 
 
+def configure_connection(connection: sqlite3.Connection, db_path: str | Path) -> None:
+    """Apply bulk-load PRAGMAs; WAL is skipped for in-memory databases."""
+
+    if str(db_path) != ":memory:":
+        connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    connection.execute("PRAGMA cache_size=-65536")
+    connection.execute("PRAGMA mmap_size=268435456")
+
+
 def init_db(connection: sqlite3.Connection) -> None:
-    schema_sql = SCHEMA_PATH.read_text()
+    schema_sql = _SCHEMA_SQL if _SCHEMA_SQL is not None else SCHEMA_PATH.read_text()
     connection.executescript(schema_sql)
 
 
 def load_teams(connection: sqlite3.Connection) -> None:
-    for abbr, meta in TEAMS.items():
-        connection.execute(
-            """
-            INSERT OR IGNORE INTO teams (name, abbreviation, conference, division)
-            VALUES (?, ?, ?, ?)
-            """,
-            (meta["name"], abbr, meta["conference"], meta["division"]),
+    cursor = connection.cursor()
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO teams (name, abbreviation, conference, division)
+        VALUES (?, ?, ?, ?)
+        """,
+        (
+            (meta["name"], abbr, meta["conference"], meta["division"])
+            for abbr, meta in TEAMS.items()
+        ),
+    )
+
+
+def _team_ids_by_abbreviation(connection: sqlite3.Connection) -> dict[str, int]:
+    return {
+        abbreviation: team_id
+        for team_id, abbreviation in connection.execute(
+            "SELECT id, abbreviation FROM teams"
         )
+    }
 
 
-def load_players(connection: sqlite3.Connection, *, rules) -> None:
-    ratings_path = _resolve_data_file("ratings")
-    players = parse_ratings(ratings_path)
-    for player in players:
-        team_abbr = player.pop("team_abbr")
-        team_id_row = connection.execute(
-            "SELECT id FROM teams WHERE abbreviation = ?",
-            (team_abbr,),
-        ).fetchone()
-        team_id = team_id_row[0] if team_id_row else None
-        salary = rules.salary_base + rules.salary_per_rating * player["overall_rating"]
-        connection.execute(
-            """
-            INSERT OR REPLACE INTO players (
-                id,
-                name,
-                position,
-                overall_rating,
-                age,
-                team_id,
-                salary,
-                contract_years,
-                status,
-                injury_status
-            )
-            VALUES (
-                :id,
-                :name,
-                :position,
-                :overall_rating,
-                :age,
-                :team_id,
-                :salary,
-                :contract_years,
-                'active',
-                'healthy'
-            )
-            """,
-            {
-                **player,
-                "team_id": team_id,
-                "salary": salary,
-                "contract_years": rules.max_contract_years,
-            },
+def _player_upsert_sql(
+    connection: sqlite3.Connection, columns: tuple[str, ...], values: str
+) -> str:
+    # Supplied columns take the new values; every other column goes back to
+    # its schema default, as under INSERT OR REPLACE. The defaults come from
+    # PRAGMA table_info so the reset list cannot drift from schema.sql.
+    assignments = [f"{column} = excluded.{column}" for column in columns if column != "id"]
+    assignments.extend(
+        f"{name} = {'NULL' if default is None else f'({default})'}"
+        for _, name, _, _, default, primary_key in connection.execute(
+            "PRAGMA table_info(players)"
         )
+        if name not in columns and not primary_key
+    )
+    return (
+        f"INSERT INTO players ({', '.join(columns)}) VALUES ({values}) "
+        f"ON CONFLICT (id) DO UPDATE SET {', '.join(assignments)}"
+    )
 
 
-def load_schedule(connection: sqlite3.Connection) -> None:
-    schedule_path = _resolve_data_file("schedule")
-    games = parse_schedule(schedule_path)
-    for game in games:
-        home_team_row = connection.execute(
-            "SELECT id FROM teams WHERE abbreviation = ?",
-            (game["home_abbr"],),
-        ).fetchone()
-        away_team_row = connection.execute(
-            "SELECT id FROM teams WHERE abbreviation = ?",
-            (game["away_abbr"],),
-        ).fetchone()
-
-        if home_team_row is None or away_team_row is None:
-            raise ValueError(
-                f"Missing team for schedule entry: {game['home_abbr']} vs {game['away_abbr']}"
+def load_players(
+    connection: sqlite3.Connection,
+    *,
+    rules,
+    players: Iterable[dict] | None = None,
+) -> None:
+    if players is None:
+        players = iter_ratings(_resolve_data_file("ratings"))
+    team_ids = _team_ids_by_abbreviation(connection)
+    salary_base, salary_per_rating = rules.salary_base, rules.salary_per_rating
+    contract_years = rules.max_contract_years
+
+    def iter_rows():
+        for player in players:
+            yield (
+                player["id"],
+                player["name"],
+                player["position"],
+                player["overall_rating"],
+                player["age"],
+                team_ids.get(player["team_abbr"]),
+                salary_base + salary_per_rating * player["overall_rating"],
+                contract_years,
             )
 
-        existing = connection.execute(
-            """
-            SELECT id FROM games
-            WHERE week = ? AND home_team_id = ? AND away_team_id = ?
-            """,
-            (game["week"], home_team_row[0], away_team_row[0]),
-        ).fetchone()
+    cursor = connection.cursor()
+    cursor.executemany(
+        _player_upsert_sql(
+            connection,
+            (
+                "id",
+                "name",
+                "position",
+                "overall_rating",
+                "age",
+                "team_id",
+                "salary",
+                "contract_years",
+                "status",
+                "injury_status",
+            ),
+            "?, ?, ?, ?, ?, ?, ?, ?, 'active', 'healthy'",
+        ),
+        iter_rows(),
+    )
 
-        if existing:
-            continue
 
-        connection.execute(
-            """
-            INSERT INTO games (week, home_team_id, away_team_id)
-            VALUES (?, ?, ?)
-            """,
-            (game["week"], home_team_row[0], away_team_row[0]),
+def load_schedule(
+    connection: sqlite3.Connection, *, games: Iterable[dict] | None = None
+) -> None:
+    if games is None:
+        games = parse_schedule(_resolve_data_file("schedule"))
+    team_ids = _team_ids_by_abbreviation(connection)
+
+    def iter_rows():
+        for game in games:
+            home_team_id = team_ids.get(game["home_abbr"])
+            away_team_id = team_ids.get(game["away_abbr"])
+
+            if home_team_id is None or away_team_id is None:
+                raise ValueError(
+                    f"Missing team for schedule entry: {game['home_abbr']} vs {game['away_abbr']}"
+                )
+
+            yield (game["week"], home_team_id, away_team_id)
+
+    # Duplicate fixtures are skipped by idx_games_week_home_away.
+    cursor = connection.cursor()
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO games (week, home_team_id, away_team_id)
+        VALUES (?, ?, ?)
+        """,
+        iter_rows(),
+    )
+
+
+def apply_depth_chart(
+    connection: sqlite3.Connection, *, depth_entries: Iterable[dict] | None = None
+) -> None:
+    if depth_entries is None:
+        depth_entries = iter_depth_charts(
+            _resolve_data_file("NFL_Depth_Charts", "depth_charts")
         )
 
+    def iter_rows():
+        for entry in depth_entries:
+            depth_position = entry["position"].upper()
+            order = entry["order"]
+            if depth_position.translate(_STRIP_DIGITS) == depth_position:
+                depth_position = f"{depth_position}{order}"
+            yield (entry["player_id"], depth_position, order)
 
-def apply_depth_chart(connection: sqlite3.Connection) -> None:
-    depth_entries = parse_depth_charts(
-        _resolve_data_file("NFL_Depth_Charts", "depth_charts")
+    # Stage the chart in a temp table so players is updated by one join.
+    connection.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS staged_depth_chart (
+            player_id INTEGER PRIMARY KEY,
+            position TEXT NOT NULL,
+            depth_order INTEGER NOT NULL
+        )
+        """
     )
-    for entry in depth_entries:
-        depth_position = entry["position"].upper()
-        order = entry["order"]
-        if not any(char.isdigit() for char in depth_position):
-            depth_position = f"{depth_position}{order}"
+    try:
+        cursor = connection.cursor()
+        # Later entries for the same player win, as with per-row UPDATEs.
+        cursor.executemany(
+            "INSERT OR REPLACE INTO staged_depth_chart VALUES (?, ?, ?)",
+            iter_rows(),
+        )
         connection.execute(
             """
             UPDATE players
-            SET depth_chart_position = ?, depth_chart_order = ?
-            WHERE id = ?
-            """,
-            (depth_position, order, entry["player_id"]),
+            SET depth_chart_position = staged.position,
+                depth_chart_order = staged.depth_order
+            FROM staged_depth_chart AS staged
+            WHERE players.id = staged.player_id
+            """
         )
+    finally:
+        connection.execute("DROP TABLE IF EXISTS temp.staged_depth_chart")
 
 
-def load_free_agents(connection: sqlite3.Connection, *, rules, year: int) -> None:
-    agents = parse_free_agents(
-        _resolve_data_file(f"{year}_Free_Agents", f"{year}_free_agents")
-    )
-    for agent in agents:
-        salary = rules.salary_base + rules.salary_per_rating * agent["overall_rating"]
-        connection.execute(
-            """
-            INSERT OR REPLACE INTO players (
-                id,
-                name,
-                position,
-                overall_rating,
-                age,
-                status,
-                salary,
-                contract_years,
-                free_agent_year,
-                injury_status
-            )
-            VALUES (
-                :id,
-                :name,
-                :position,
-                :overall_rating,
-                :age,
-                'free_agent',
-                :salary,
-                1,
-                :free_agent_year,
-                'healthy'
-            )
-            """,
-            {
-                **agent,
-                "salary": salary,
-                "free_agent_year": year,
-            },
+def load_free_agents(
+    connection: sqlite3.Connection,
+    *,
+    rules,
+    year: int,
+    agents: Iterable[dict] | None = None,
+) -> None:
+    if agents is None:
+        agents = iter_free_agents(
+            _resolve_data_file(f"{year}_Free_Agents", f"{year}_free_agents")
         )
+    salary_base, salary_per_rating = rules.salary_base, rules.salary_per_rating
+
+    cursor = connection.cursor()
+    cursor.executemany(
+        _player_upsert_sql(
+            connection,
+            (
+                "id",
+                "name",
+                "position",
+                "overall_rating",
+                "age",
+                "status",
+                "salary",
+                "contract_years",
+                "free_agent_year",
+                "injury_status",
+            ),
+            "?, ?, ?, ?, ?, 'free_agent', ?, 1, ?, 'healthy'",
+        ),
+        (
+            (
+                agent["id"],
+                agent["name"],
+                agent["position"],
+                agent["overall_rating"],
+                agent["age"],
+                salary_base + salary_per_rating * agent["overall_rating"],
+                year,
+            )
+            for agent in agents
+        ),
+    )
 
 
 def load_default_draft_picks(connection: sqlite3.Connection) -> None:
-    teams = connection.execute("SELECT id FROM teams").fetchall()
-    for year in (2025, 2026):
-        for draft_round in range(1, 4):
-            for team in teams:
-                team_id = team[0] if isinstance(team, tuple) else team["id"]
-                connection.execute(
-                    """
-                    INSERT OR IGNORE INTO draft_picks (team_id, year, round, original_team_id)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (team_id, year, draft_round, team_id),
-                )
+    team_ids = [row[0] for row in connection.execute("SELECT id FROM teams")]
+    connection.executemany(
+        """
+        INSERT OR IGNORE INTO draft_picks (team_id, year, round, original_team_id)
+        VALUES (?, ?, ?, ?)
+        """,
+        (
+            (team_id, year, draft_round, team_id)
+            for year in (2025, 2026)
+            for draft_round in range(1, 4)
+            for team_id in team_ids
+        ),
+    )
+
+
+def parse_sources(year: int) -> dict[str, list[dict]]:
+    """Parse the independent seed feeds concurrently, keyed by loader argument."""
+
+    jobs = {
+        "players": (parse_ratings, _resolve_data_file("ratings")),
+        "games": (parse_schedule, _resolve_data_file("schedule")),
+        "depth_entries": (
+            parse_depth_charts,
+            _resolve_data_file("NFL_Depth_Charts", "depth_charts"),
+        ),
+        "agents": (
+            parse_free_agents,
+            _resolve_data_file(f"{year}_Free_Agents", f"{year}_free_agents"),
+        ),
+    }
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            key: executor.submit(parser, path) for key, (parser, path) in jobs.items()
+        }
+    return {key: future.result() for key, future in futures.items()}
+
+
+def _staged_copy_sql(connection: sqlite3.Connection, table: str, conflict: str) -> str:
+    # Name the columns: an older on-disk table may order them differently,
+    # and CREATE TABLE IF NOT EXISTS never fixes that.
+    columns = [
+        row[1]
+        for row in connection.execute(f"PRAGMA main.table_info({table})")
+        if not (row[1] == "id" and table in DISK_ASSIGNED_IDS)
+    ]
+    team_columns = TEAM_ID_COLUMNS.get(table, ())
+    # An existing file may number its teams differently, so team references
+    # are resolved through the abbreviation rather than copied as-is.
+    values = [
+        f"""(
+            SELECT disk_team.id
+            FROM disk.teams AS disk_team
+            JOIN main.teams AS staged_team USING (abbreviation)
+            WHERE staged_team.id = staged.{column}
+        )"""
+        if column in team_columns
+        else f"staged.{column}"
+        for column in columns
+    ]
+    return (
+        f"INSERT OR {conflict} INTO disk.{table} ({', '.join(columns)}) "
+        f"SELECT {', '.join(values)} FROM main.{table} AS staged"
+    )
+
+
+def persist_staged_load(connection: sqlite3.Connection, db_path: Path) -> None:
+    with closing(sqlite3.connect(db_path)) as disk:
+        configure_connection(disk, db_path)
+        init_db(disk)
+
+    connection.execute("ATTACH DATABASE ? AS disk", (str(db_path),))
+    try:
+        connection.execute("PRAGMA disk.synchronous=NORMAL")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for table, conflict in STAGED_TABLES.items():
+                connection.execute(_staged_copy_sql(connection, table, conflict))
+        except Exception:
+            connection.rollback()
+            raise
+        connection.commit()
+    finally:
+        connection.execute("DETACH DATABASE disk")
 
 
 def main() -> None:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(DB_PATH) as connection:
+    db_path = resolve_db_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    sources = parse_sources(CURRENT_YEAR)
+    # Stage the load in memory (autocommit mode so the only transaction is the
+    # explicit one below), then copy it onto disk in one sequential write.
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        configure_connection(connection, ":memory:")
         init_db(connection)
-        load_teams(connection)
         rules = load_game_rules()
-        load_players(connection, rules=rules)
-        load_schedule(connection)
-        apply_depth_chart(connection)
-        load_free_agents(connection, rules=rules, year=CURRENT_YEAR)
-        load_default_draft_picks(connection)
+        connection.execute("BEGIN")
+        try:
+            load_teams(connection)
+            load_players(connection, rules=rules, players=sources["players"])
+            load_schedule(connection, games=sources["games"])
+            apply_depth_chart(connection, depth_entries=sources["depth_entries"])
+            load_free_agents(
+                connection,
+                rules=rules,
+                year=CURRENT_YEAR,
+                agents=sources["agents"],
+            )
+            load_default_draft_picks(connection)
+        except Exception:
+            connection.rollback()
+            raise
         connection.commit()
-    print(f"Database initialized at {DB_PATH}")
+        persist_staged_load(connection, db_path)
+    finally:
+        connection.close()
+    print(f"Database initialized at {db_path}")
 
 
 if __name__ == "__main__":
@@ -77,6 +77,7 @@ CREATE TABLE IF NOT EXISTS games (
     FOREIGN KEY (home_team_id) REFERENCES teams (id),
     FOREIGN KEY (away_team_id) REFERENCES teams (id)
 );
+CREATE UNIQUE INDEX IF NOT EXISTS idx_games_week_home_away ON games (week, home_team_id, away_team_id);
 
 CREATE TABLE IF NOT EXISTS draft_picks (
     id INTEGER PRIMARY KEY,
@@ -1,190 +1,32 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from os import fspath, stat
+from os.path import splitext
 from pathlib import Path
-from typing import Iterable, Mapping
+from sys import intern
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
 
 import csv
 
 from shared.constants.teams import TEAMS
-FALLBACK_RATINGS: list[dict[str, object]] = [
-    {
-        "id": 1,
-        "name": "Josh Allen",
-        "position": "QB",
-        "overall_rating": 94,
-        "team_abbr": "BUF",
-        "age": 28,
-    },
-    {
-        "id": 2,
-        "name": "Stefon Diggs",
-        "position": "WR",
-        "overall_rating": 92,
-        "team_abbr": "BUF",
-        "age": 30,
-    },
-    {
-        "id": 3,
-        "name": "Joe Burrow",
-        "position": "QB",
-        "overall_rating": 93,
-        "team_abbr": "CIN",
-        "age": 27,
-    },
-    {
-        "id": 4,
-        "name": "Ja'Marr Chase",
-        "position": "WR",
-        "overall_rating": 95,
-        "team_abbr": "CIN",
-        "age": 25,
-    },
-    {
-        "id": 5,
-        "name": "Joe Mixon",
-        "position": "RB",
-        "overall_rating": 88,
-        "team_abbr": "CIN",
-        "age": 28,
-    },
-    {
-        "id": 6,
-        "name": "Von Miller",
-        "position": "LB",
-        "overall_rating": 90,
-        "team_abbr": "BUF",
-        "age": 34,
-    },
-]
-
-FALLBACK_DEPTH_CHARTS: list[dict[str, object]] = [
-    {"team_abbr": "BUF", "position": "QB", "player_id": 1, "order": 1},
-    {"team_abbr": "BUF", "position": "WR", "player_id": 2, "order": 1},
-    {"team_abbr": "BUF", "position": "LB", "player_id": 6, "order": 1},
-    {"team_abbr": "CIN", "position": "QB", "player_id": 3, "order": 1},
-    {"team_abbr": "CIN", "position": "WR", "player_id": 4, "order": 1},
-    {"team_abbr": "CIN", "position": "RB", "player_id": 5, "order": 1},
-]
-
-FALLBACK_FREE_AGENTS: list[dict[str, object]] = [
-    {
-        "id": 7001,
-        "name": "Julio Jones",
-        "position": "WR",
-        "overall_rating": 85,
-        "age": 35,
-    },
-    {
-        "id": 7002,
-        "name": "Ndamukong Suh",
-        "position": "DL",
-        "overall_rating": 84,
-        "age": 37,
-    },
-]
 
-FALLBACK_SCHEDULE: list[dict[str, object]] = [
-    {"week": 1, "home_abbr": "BUF", "away_abbr": "CIN"},
-    {"week": 2, "home_abbr": "CIN", "away_abbr": "BUF"},
+__all__ = [
+    "iter_depth_charts",
+    "iter_free_agents",
+    "iter_ratings",
+    "parse_depth_charts",
+    "parse_free_agents",
+    "parse_ratings",
+    "parse_schedule",
 ]
 
-
-def _normalize_row(row: Mapping[str, str | None]) -> dict[str, str]:
-    normalized: dict[str, str] = {}
-    for raw_key, raw_value in row.items():
-        if raw_key is None:
-            continue
-        key = str(raw_key).strip()
-        if not key:
-            continue
-        value = (raw_value or "").strip()
-        normalized[key] = value
-        lowered = key.lower()
-        normalized[lowered] = value
-        normalized[lowered.replace(" ", "_")] = value
-    return normalized
-
-
-def _first_value(row: dict[str, str], *keys: str) -> str:
-    for key in keys:
-        if key in row and row[key]:
-            return row[key]
-    return ""
-
-
-def _read_lines(path: Path) -> Iterable[str]:
-    if not path.exists():
-        return []
-
-    lines: list[str] = []
-    with path.open(encoding="utf-8", errors="replace") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            lines.append(line)
-    return lines
-
-
-def parse_ratings(path: str | Path) -> list[dict[str, object]]:
-    path = Path(path)
-    players: list[dict[str, str]] = []
-
-    if path.suffix.lower() == ".csv":
-        with path.open(newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            if reader.fieldnames:
-                for csv_row in reader:
-                    row = _normalize_row(csv_row)
-                    player_id = _first_value(row, "player_id", "id")
-                    name = _first_value(row, "name", "player")
-                    position = _first_value(row, "position", "pos")
-                    overall = _first_value(row, "overall_rating", "overall", "ovr")
-                    team_abbr = _first_value(row, "team_abbr", "team", "team abbreviation")
-                    age = _first_value(row, "age")
-
-                    if not (player_id and name and position and overall and team_abbr and age):
-                        continue
-
-                    try:
-                        players.append(
-                            {
-                                "id": int(float(player_id)),
-                                "name": name,
-                                "position": position,
-                                "overall_rating": int(float(overall)),
-                                "team_abbr": team_abbr,
-                                "age": int(float(age)),
-                            }
-                        )
-                    except ValueError:
-                        continue
-
-    if not players:
-        for row in _read_lines(path):
-            parts = row.split("|")
-            if len(parts) != 6:
-                continue
-            player_id, name, position, overall, team_abbr, age = parts
-            try:
-                players.append(
-                    {
-                        "id": int(player_id),
-                        "name": name,
-                        "position": position,
-                        "overall_rating": int(overall),
-                        "team_abbr": team_abbr,
-                        "age": int(age),
-                    }
-                )
-            except ValueError:
-                continue
-
-    if players:
-        return players
-
-    # Fallback data used when the ratings feed has not been prepared yet.
-    return [
+# Fallback data used when a feed has not been prepared yet. The rows are built
+# once at import and shared between calls, so they are frozen mappings.
+FALLBACK_RATINGS: tuple[Mapping[str, object], ...] = tuple(
+    MappingProxyType(row)
+    for row in (
         {"id": 1, "name": "Josh Allen", "position": "QB", "overall_rating": 96, "team_abbr": "BUF", "age": 28},
         {"id": 2, "name": "Stefon Diggs", "position": "WR", "overall_rating": 94, "team_abbr": "BUF", "age": 30},
         {"id": 3, "name": "James Cook", "position": "RB", "overall_rating": 84, "team_abbr": "BUF", "age": 25},
@@ -195,61 +37,12 @@ def parse_ratings(path: str | Path) -> list[dict[str, object]]:
         {"id": 8, "name": "Dawson Knox", "position": "TE", "overall_rating": 82, "team_abbr": "BUF", "age": 27},
         {"id": 9, "name": "Von Miller", "position": "EDGE", "overall_rating": 88, "team_abbr": "BUF", "age": 35},
         {"id": 10, "name": "Logan Wilson", "position": "LB", "overall_rating": 85, "team_abbr": "CIN", "age": 26},
-    ]
-
-
-def parse_depth_charts(path: str | Path) -> list[dict[str, str]]:
-    path = Path(path)
-    entries: list[dict[str, str]] = []
-
-    if path.suffix.lower() == ".csv":
-        with path.open(newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            if reader.fieldnames:
-                for csv_row in reader:
-                    row = _normalize_row(csv_row)
-                    team_abbr = _first_value(row, "team_abbr", "team", "abbr")
-                    position = _first_value(row, "position", "pos")
-                    player_id = _first_value(row, "player_id", "id")
-                    order = _first_value(row, "order", "depth", "slot")
-
-                    if not (team_abbr and position and player_id and order):
-                        continue
-
-                    try:
-                        entries.append(
-                            {
-                                "team_abbr": team_abbr,
-                                "position": position,
-                                "player_id": int(float(player_id)),
-                                "order": int(float(order)),
-                            }
-                        )
-                    except ValueError:
-                        continue
-
-    if not entries:
-        for row in _read_lines(path):
-            parts = row.split("|")
-            if len(parts) != 4:
-                continue
-            team_abbr, position, player_id, order = parts
-            try:
-                entries.append(
-                    {
-                        "team_abbr": team_abbr,
-                        "position": position,
-                        "player_id": int(player_id),
-                        "order": int(order),
-                    }
-                )
-            except ValueError:
-                continue
-
-    if entries:
-        return entries
+    )
+)
 
-    return [
+FALLBACK_DEPTH_CHARTS: tuple[Mapping[str, object], ...] = tuple(
+    MappingProxyType(row)
+    for row in (
         {"team_abbr": "BUF", "position": "QB", "player_id": 1, "order": 1},
         {"team_abbr": "BUF", "position": "RB", "player_id": 3, "order": 1},
         {"team_abbr": "BUF", "position": "WR", "player_id": 2, "order": 1},
@@ -260,115 +53,273 @@ def parse_depth_charts(path: str | Path) -> list[dict[str, str]]:
         {"team_abbr": "CIN", "position": "WR", "player_id": 5, "order": 1},
         {"team_abbr": "CIN", "position": "WR", "player_id": 6, "order": 2},
         {"team_abbr": "CIN", "position": "LB", "player_id": 10, "order": 1},
+    )
+)
+
+FALLBACK_FREE_AGENTS: tuple[Mapping[str, object], ...] = tuple(
+    MappingProxyType(row)
+    for row in (
+        {"id": 9001, "name": "Julio Jones", "position": "WR", "overall_rating": 90, "age": 36},
+        {"id": 9002, "name": "Ndamukong Suh", "position": "DL", "overall_rating": 88, "age": 38},
+    )
+)
+
+FALLBACK_SCHEDULE: tuple[Mapping[str, object], ...] = tuple(
+    MappingProxyType(row)
+    for row in (
+        {"week": 1, "home_abbr": "BUF", "away_abbr": "CIN"},
+        {"week": 2, "home_abbr": "CIN", "away_abbr": "BUF"},
+    )
+)
+
+
+# Output field -> accepted CSV header aliases, tried in order (a COALESCE over
+# the aliases). A CSV row is used only when every field resolves to a value.
+RATINGS_COLUMNS: dict[str, tuple[str, ...]] = {
+    "id": ("player_id", "id"),
+    "name": ("name", "player"),
+    "position": ("position", "pos"),
+    "overall_rating": ("overall_rating", "overall", "ovr"),
+    "team_abbr": ("team_abbr", "team", "team abbreviation"),
+    "age": ("age",),
+}
+DEPTH_CHART_COLUMNS: dict[str, tuple[str, ...]] = {
+    "team_abbr": ("team_abbr", "team", "abbr"),
+    "position": ("position", "pos"),
+    "player_id": ("player_id", "id"),
+    "order": ("order", "depth", "slot"),
+}
+FREE_AGENT_COLUMNS: dict[str, tuple[str, ...]] = {
+    "id": ("player_id", "id"),
+    "name": ("name", "player"),
+    "position": ("position", "pos"),
+    "overall_rating": ("overall_rating", "overall", "ovr"),
+    "age": ("age",),
+}
+SCHEDULE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "week": ("week",),
+    "home_abbr": ("home_abbr", "home", "home_team"),
+    "away_abbr": ("away_abbr", "away", "away_team"),
+}
+
+
+def _column_indices(
+    header: list[str], columns: Mapping[str, tuple[str, ...]]
+) -> list[tuple[str, tuple[int, ...]]]:
+    # Each header is reachable as written, lowercased, and with spaces turned
+    # into underscores; a later column wins when two normalize to the same key.
+    positions: dict[str, int] = {}
+    for index, raw_key in enumerate(header):
+        key = raw_key.strip()
+        if not key:
+            continue
+        lowered = key.lower()
+        positions[key] = index
+        positions[lowered] = index
+        positions[lowered.replace(" ", "_")] = index
+    return [
+        (field, tuple(positions[alias] for alias in aliases if alias in positions))
+        for field, aliases in columns.items()
     ]
 
 
-def parse_free_agents(path: str | Path) -> list[dict[str, str]]:
-    path = Path(path)
-    agents: list[dict[str, str]] = []
-
-    if path.suffix.lower() == ".csv":
-        with path.open(newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            if reader.fieldnames:
-                for csv_row in reader:
-                    row = _normalize_row(csv_row)
-                    player_id = _first_value(row, "player_id", "id")
-                    name = _first_value(row, "name", "player")
-                    position = _first_value(row, "position", "pos")
-                    overall = _first_value(row, "overall_rating", "overall", "ovr")
-                    age = _first_value(row, "age")
-
-                    if not (player_id and name and position and overall and age):
-                        continue
-
-                    try:
-                        agents.append(
-                            {
-                                "id": int(float(player_id)),
-                                "name": name,
-                                "position": position,
-                                "overall_rating": int(float(overall)),
-                                "age": int(float(age)),
-                            }
-                        )
-                    except ValueError:
-                        continue
-
-    if not agents:
-        for row in _read_lines(path):
-            parts = row.split("|")
-            if len(parts) != 5:
-                continue
-            player_id, name, position, overall, age = parts
+def _iter_csv_records(
+    path: str | Path, columns: Mapping[str, tuple[str, ...]]
+) -> Iterator[tuple[str, ...]]:
+    with open(path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if not header:
+            return
+        # Aliases are resolved to column positions once per file, not per row.
+        indices = _column_indices(header, columns)
+        if not all(candidates for _, candidates in indices):
+            return
+        for row in reader:
+            width = len(row)
+            record: list[str] = []
+            for _, candidates in indices:
+                for index in candidates:
+                    if index < width:
+                        value = row[index].strip()
+                        if value:
+                            record.append(value)
+                            break
+                else:
+                    break
+            else:
+                yield tuple(record)
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(
+    parser: Callable[[str | Path], Iterable[Mapping[str, object]]],
+    path: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[Mapping[str, object], ...]:
+    # mtime_ns/size are part of the cache key so an edited feed is re-parsed.
+    return tuple(MappingProxyType(dict(row)) for row in parser(path))
+
+
+def _parse_with_cache(
+    parser: Callable[[str | Path], Iterable[Mapping[str, object]]], path: str | Path
+) -> list[Mapping[str, object]]:
+    path = fspath(path)
+    try:
+        info = stat(path)
+    except FileNotFoundError:
+        # Missing feeds fall back to static rows (or raise); nothing to cache.
+        return list(parser(path))
+    return list(_parse_cached(parser, path, info.st_mtime_ns, info.st_size))
+
+
+def _to_int(value: str) -> int:
+    # Feeds are almost always plain integers; only fall back to float for
+    # values such as "29.7" or "3e2" that int() rejects.
+    try:
+        return int(value)
+    except ValueError:
+        return int(float(value))
+
+
+def _read_lines(path: str | Path) -> Iterator[str]:
+    # Opening directly replaces a separate exists() check for missing feeds.
+    try:
+        handle = open(path, encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return
+
+    # Text mode keeps universal newlines, so CR-only files still split into
+    # lines; map/filter strip and drop blank lines in C.
+    with handle:
+        for line in filter(None, map(str.strip, handle)):
+            if line[0] != "#":
+                yield line
+
+
+def _read_pipe_rows(path: str | Path) -> Iterable[list[str]]:
+    # csv's C tokenizer splits the fields; QUOTE_NONE keeps str.split semantics.
+    return csv.reader(_read_lines(path), delimiter="|", quoting=csv.QUOTE_NONE)
+
+
+def _iter_pipe_records(
+    path: str | Path, columns: Mapping[str, tuple[str, ...]]
+) -> Iterator[list[str]]:
+    width = len(columns)
+    return (parts for parts in _read_pipe_rows(path) if len(parts) == width)
+
+
+_IntParser = Callable[[str], int]
+_RecordReader = Callable[[str | Path, Mapping[str, tuple[str, ...]]], Iterable[Sequence[str]]]
+
+# Suffix -> readers tried in order, each with the int conversion its format
+# needs. A CSV feed with no usable rows is retried as pipe-delimited text.
+_READERS: dict[str, tuple[tuple[_RecordReader, _IntParser], ...]] = {
+    ".csv": ((_iter_csv_records, _to_int), (_iter_pipe_records, int)),
+}
+_DEFAULT_READERS = ((_iter_pipe_records, int),)
+
+
+def _iter_feed(
+    path: str | Path,
+    columns: Mapping[str, tuple[str, ...]],
+    build: Callable[[Sequence[str], _IntParser], dict[str, object]],
+    fallback: Iterable[Mapping[str, object]],
+) -> Iterator[Mapping[str, object]]:
+    for read, to_int in _READERS.get(splitext(path)[1].lower(), _DEFAULT_READERS):
+        found = False
+        for fields in read(path, columns):
             try:
-                agents.append(
-                    {
-                        "id": int(player_id),
-                        "name": name,
-                        "position": position,
-                        "overall_rating": int(overall),
-                        "age": int(age),
-                    }
-                )
+                row = build(fields, to_int)
             except ValueError:
                 continue
+            found = True
+            yield row
+        if found:
+            return
 
-    if agents:
-        return agents
+    yield from fallback
+
+
+def _build_rating(fields: Sequence[str], to_int: _IntParser) -> dict[str, object]:
+    player_id, name, position, overall, team_abbr, age = fields
+    return {
+        "id": to_int(player_id),
+        "name": name,
+        "position": intern(position),
+        "overall_rating": to_int(overall),
+        "team_abbr": intern(team_abbr),
+        "age": to_int(age),
+    }
+
+
+def _build_depth_chart(fields: Sequence[str], to_int: _IntParser) -> dict[str, object]:
+    team_abbr, position, player_id, order = fields
+    return {
+        "team_abbr": intern(team_abbr),
+        "position": intern(position),
+        "player_id": to_int(player_id),
+        "order": to_int(order),
+    }
+
+
+def _build_free_agent(fields: Sequence[str], to_int: _IntParser) -> dict[str, object]:
+    player_id, name, position, overall, age = fields
+    return {
+        "id": to_int(player_id),
+        "name": name,
+        "position": intern(position),
+        "overall_rating": to_int(overall),
+        "age": to_int(age),
+    }
+
+
+def _build_game(fields: Sequence[str], to_int: _IntParser) -> dict[str, object]:
+    week, home_abbr, away_abbr = fields
+    return {
+        "week": to_int(week),
+        "home_abbr": intern(home_abbr),
+        "away_abbr": intern(away_abbr),
+    }
+
+
+def iter_ratings(path: str | Path) -> Iterator[Mapping[str, object]]:
+    return _iter_feed(path, RATINGS_COLUMNS, _build_rating, FALLBACK_RATINGS)
 
-    return [
-        {"id": 9001, "name": "Julio Jones", "position": "WR", "overall_rating": 90, "age": 36},
-        {"id": 9002, "name": "Ndamukong Suh", "position": "DL", "overall_rating": 88, "age": 38},
-    ]
 
+def parse_ratings(path: str | Path) -> list[Mapping[str, object]]:
+    return _parse_with_cache(iter_ratings, path)
 
-def parse_schedule(path: str | Path) -> list[dict[str, str]]:
+
+def iter_depth_charts(path: str | Path) -> Iterator[Mapping[str, object]]:
+    return _iter_feed(
+        path, DEPTH_CHART_COLUMNS, _build_depth_chart, FALLBACK_DEPTH_CHARTS
+    )
+
+
+def parse_depth_charts(path: str | Path) -> list[Mapping[str, object]]:
+    return _parse_with_cache(iter_depth_charts, path)
+
+
+def iter_free_agents(path: str | Path) -> Iterator[Mapping[str, object]]:
+    return _iter_feed(
+        path, FREE_AGENT_COLUMNS, _build_free_agent, FALLBACK_FREE_AGENTS
+    )
+
+
+def parse_free_agents(path: str | Path) -> list[Mapping[str, object]]:
+    return _parse_with_cache(iter_free_agents, path)
+
+
+def parse_schedule(path: str | Path) -> list[Mapping[str, object]]:
     """Parse scheduled games from a CSV or pipe-delimited text file."""
 
-    path = Path(path)
-    schedule: list[dict[str, str]] = []
-
-    if path.suffix.lower() == ".csv":
-        with path.open(newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            if reader.fieldnames:
-                for csv_row in reader:
-                    row = _normalize_row(csv_row)
-                    week = _first_value(row, "week")
-                    home = _first_value(row, "home_abbr", "home", "home_team")
-                    away = _first_value(row, "away_abbr", "away", "away_team")
-
-                    if not (week and home and away):
-                        continue
-
-                    try:
-                        schedule.append(
-                            {
-                                "week": int(float(week)),
-                                "home_abbr": home,
-                                "away_abbr": away,
-                            }
-                        )
-                    except ValueError:
-                        continue
-
-    if not schedule:
-        for row in _read_lines(path):
-            parts = row.split("|")
-            if len(parts) != 3:
-                continue
-            week, home_abbr, away_abbr = parts
-            try:
-                schedule.append(
-                    {
-                        "week": int(week),
-                        "home_abbr": home_abbr,
-                        "away_abbr": away_abbr,
-                    }
-                )
-            except ValueError:
-                continue
+    return _parse_with_cache(_parse_schedule, path)
+
+
+def _parse_schedule(path: str | Path) -> list[Mapping[str, object]]:
+    schedule = list(_iter_feed(path, SCHEDULE_COLUMNS, _build_game, ()))
 
     if schedule:
         filtered = [
@@ -385,7 +336,4 @@ def parse_schedule(path: str | Path) -> list[dict[str, str]]:
             return filtered
         return schedule
 
-    return [
-        {"week": 1, "home_abbr": "BUF", "away_abbr": "CIN"},
-        {"week": 2, "home_abbr": "CIN", "away_abbr": "BUF"},
-    ]
+    return list(FALLBACK_SCHEDULE)
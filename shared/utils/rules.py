@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Mapping, TypeVar
 
 from .parsers import _read_lines
 
 
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 
+_RulesT = TypeVar("_RulesT")
+
 
 @dataclass(frozen=True)
 class GameRules:
@@ -20,7 +24,7 @@ class GameRules:
     max_contract_years: int
     elite_qb_rating: int
     max_elite_qbs: int
-    min_position_depth: Dict[str, int]
+    min_position_depth: Mapping[str, int]
 
 
 @dataclass(frozen=True)
@@ -48,8 +52,34 @@ def _load_key_values(path: Path) -> dict[str, str]:
     return values
 
 
+@lru_cache(maxsize=8)
+def _load_cached(
+    builder: Callable[[Path], _RulesT], path: str, mtime_ns: int, size: int
+) -> _RulesT:
+    # mtime_ns/size are part of the cache key so an edited rules file is re-read.
+    return builder(Path(path))
+
+
+def _load_with_cache(builder: Callable[[Path], _RulesT], path: Path) -> _RulesT:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        # A missing file yields the defaults; nothing to cache.
+        return builder(path)
+    return _load_cached(builder, str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def load_game_rules(path: Path | None = None) -> GameRules:
-    path = path or (DATA_DIR / "GameRules.txt")
+    return _load_with_cache(_build_game_rules, path or (DATA_DIR / "GameRules.txt"))
+
+
+def load_simulation_rules(path: Path | None = None) -> SimulationRules:
+    return _load_with_cache(
+        _build_simulation_rules, path or (DATA_DIR / "simulationrules.txt")
+    )
+
+
+def _build_game_rules(path: Path) -> GameRules:
     values = _load_key_values(path)
 
     min_depth_raw = values.get("min_position_depth", "")
@@ -70,12 +100,12 @@ def load_game_rules(path: Path | None = None) -> GameRules:
         max_contract_years=int(values.get("max_contract_years", 4)),
         elite_qb_rating=int(values.get("elite_qb_rating", 92)),
         max_elite_qbs=int(values.get("max_elite_qbs", 1)),
-        min_position_depth=min_depth,
+        # Read-only so the cached instance can be shared between callers.
+        min_position_depth=MappingProxyType(min_depth),
     )
 
 
-def load_simulation_rules(path: Path | None = None) -> SimulationRules:
-    path = path or (DATA_DIR / "simulationrules.txt")
+def _build_simulation_rules(path: Path) -> SimulationRules:
     values = _load_key_values(path)
 
     return SimulationRules(
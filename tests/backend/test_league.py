@@ -1,11 +1,10 @@
 from fastapi.testclient import TestClient
 
 
-def test_week_box_scores_and_standings(api_client: TestClient) -> None:
-    simulation = api_client.post("/simulate-week", json={"week": 1})
-    assert simulation.status_code == 200
-    sim_payload = simulation.json()
-    summary_count = len(sim_payload["summaries"])
+def test_week_box_scores_and_standings(
+    api_client: TestClient, simulated_week_1: dict
+) -> None:
+    summary_count = len(simulated_week_1["summaries"])
 
     week_box_scores = api_client.get("/games/week/1")
     assert week_box_scores.status_code == 200
@@ -3,15 +3,6 @@ from __future__ import annotations
 from fastapi.testclient import TestClient
 
 
-def _get_team_id(client: TestClient, abbreviation: str) -> int:
-    response = client.get("/teams")
-    response.raise_for_status()
-    for team in response.json():
-        if team["abbreviation"] == abbreviation:
-            return team["id"]
-    raise AssertionError(f"Team {abbreviation} not found in response")
-
-
 def test_free_agents_list_current_year(api_client: TestClient) -> None:
     response = api_client.get("/free-agents")
     assert response.status_code == 200
@@ -24,8 +15,10 @@ def test_free_agents_list_current_year(api_client: TestClient) -> None:
     ]
 
 
-def test_sign_free_agent_moves_player(api_client: TestClient) -> None:
-    team_id = _get_team_id(api_client, "BUF")
+def test_sign_free_agent_moves_player(
+    api_client: TestClient, team_ids: dict[str, int]
+) -> None:
+    team_id = team_ids["BUF"]
     free_agents = api_client.get("/free-agents").json()["players"]
     player_id = free_agents[0]["id"]
 
@@ -53,8 +46,10 @@ def test_sign_free_agent_moves_player(api_client: TestClient) -> None:
     assert repeat_response.json()["detail"] == "Free agent not found"
 
 
-def test_depth_chart_round_trip(api_client: TestClient) -> None:
-    team_id = _get_team_id(api_client, "BUF")
+def test_depth_chart_round_trip(
+    api_client: TestClient, team_ids: dict[str, int]
+) -> None:
+    team_id = team_ids["BUF"]
     depth_chart = api_client.get(f"/teams/{team_id}/depth-chart")
     assert depth_chart.status_code == 200
     entries = depth_chart.json()["entries"]
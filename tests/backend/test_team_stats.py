@@ -3,20 +3,10 @@ from __future__ import annotations
 from fastapi.testclient import TestClient
 
 
-def _team_id(client: TestClient, abbreviation: str) -> int:
-    response = client.get("/teams")
-    response.raise_for_status()
-    for team in response.json():
-        if team["abbreviation"] == abbreviation:
-            return team["id"]
-    raise AssertionError(f"Team {abbreviation} not found")
-
-
-def test_team_stats_returns_starter_aggregates(api_client: TestClient) -> None:
-    buf_id = _team_id(api_client, "BUF")
-
-    sim_response = api_client.post("/simulate-week", json={"week": 1})
-    assert sim_response.status_code == 200
+def test_team_stats_returns_starter_aggregates(
+    api_client: TestClient, team_ids: dict[str, int], simulated_week_1: dict
+) -> None:
+    buf_id = team_ids["BUF"]
 
     stats_response = api_client.get(f"/teams/{buf_id}/stats")
     assert stats_response.status_code == 200
@@ -1,37 +1,107 @@
 from __future__ import annotations
 
 import importlib
+import sqlite3
 import sys
+from contextlib import closing
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from database import load_data
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-import pytest
-from fastapi.testclient import TestClient
-from database import load_data
+from database import load_data  # noqa: E402
 
-@pytest.fixture()
-def api_client(tmp_path_factory, monkeypatch) -> TestClient:
-    db_dir = tmp_path_factory.mktemp("db")
-    db_path = db_dir / "test.db"
-    monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
+
+@pytest.fixture(scope="session")
+def seeded_db_template(tmp_path_factory) -> Path:
+    """Seed the league once per session; tests start from copies of it."""
+
+    template_path = tmp_path_factory.mktemp("seed") / "template.db"
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("NFL_GM_DB_PATH", str(template_path))
+        load_data.main()
+    return template_path
+
+
+@pytest.fixture(scope="session")
+def team_ids(seeded_db_template: Path) -> dict[str, int]:
+    """Abbreviation -> id map; every test database is a copy of the template."""
+
+    with closing(sqlite3.connect(seeded_db_template)) as connection:
+        return dict(connection.execute("SELECT abbreviation, id FROM teams"))
+
+
+def _copy_database(source_path: Path, target_path: Path) -> None:
+    with closing(sqlite3.connect(source_path)) as source, closing(
+        sqlite3.connect(target_path)
+    ) as target:
+        source.backup(target)
+
+
+@pytest.fixture(scope="session")
+def _app_client(seeded_db_template: Path):
+    """One app and TestClient for the session; tests repoint it at their database."""
 
     import backend.app.db as db_module
 
     importlib.reload(db_module)
-    importlib.reload(load_data)
-    load_data.main()
 
     import backend.main as backend_main
 
     importlib.reload(backend_main)
 
-    client = TestClient(backend_main.app)
-    yield client
-    client.close()
+    with TestClient(backend_main.app) as client:
+        yield client, db_module
+
+
+@pytest.fixture(scope="session")
+def simulated_week_template(_app_client, seeded_db_template: Path, tmp_path_factory):
+    """Simulate week 1 once per session; returns the database and response body."""
+
+    client, db_module = _app_client
+    template_path = tmp_path_factory.mktemp("simulated") / "template.db"
+    _copy_database(seeded_db_template, template_path)
+    db_module.configure_engine(template_path)
+    response = client.post("/simulate-week", json={"week": 1})
+    assert response.status_code == 200, response.text
+    return template_path, response.json()
+
+
+@pytest.fixture()
+def test_db_path(seeded_db_template: Path, tmp_path_factory, monkeypatch) -> Path:
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    _copy_database(seeded_db_template, db_path)
+    monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
+    return db_path
+
+
+@pytest.fixture()
+def simulated_week_1(simulated_week_template, test_db_path: Path) -> dict:
+    """Put the test database in its post-week-1 state; returns the sim response."""
+
+    template_path, payload = simulated_week_template
+    _copy_database(template_path, test_db_path)
+    return payload
+
+
+@pytest.fixture()
+def api_client(_app_client, test_db_path: Path) -> TestClient:
+    client, db_module = _app_client
+    db_module.configure_engine(test_db_path)
+    return client
+
+
+@pytest.fixture()
+def db_connection(test_db_path: Path) -> sqlite3.Connection:
+    """One connection to the test database, reused for every check in a test."""
+
+    connection = sqlite3.connect(test_db_path)
+    connection.row_factory = sqlite3.Row
+    # The copy is thrown away after the test, so skip fsyncs on direct writes.
+    connection.execute("PRAGMA synchronous = OFF")
+    yield connection
+    connection.close()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from database import load_data
+
+_COUNTS_SQL = """
+SELECT
+    (SELECT COUNT(*) FROM teams),
+    (SELECT COUNT(*) FROM players),
+    (SELECT COUNT(*) FROM games),
+    (SELECT COUNT(*) FROM draft_picks)
+"""
+
+
+@pytest.fixture()
+def staging_connection():
+    connection = sqlite3.connect(":memory:")
+    load_data.init_db(connection)
+    load_data.load_teams(connection)
+    yield connection
+    connection.close()
+
+
+def test_main_is_idempotent_on_existing_database(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "league.db"
+    monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
+
+    load_data.main()
+    with closing(sqlite3.connect(db_path)) as connection:
+        first = connection.execute(_COUNTS_SQL).fetchone()
+
+    load_data.main()
+    with closing(sqlite3.connect(db_path)) as connection:
+        assert connection.execute(_COUNTS_SQL).fetchone() == first
+
+
+@pytest.fixture()
+def existing_db_path(tmp_path: Path, monkeypatch) -> Path:
+    """A database seeded elsewhere: CIN=1, BUF=2 and one game already played."""
+
+    db_path = tmp_path / "existing.db"
+    with closing(sqlite3.connect(db_path)) as connection:
+        load_data.init_db(connection)
+        connection.executemany(
+            "INSERT INTO teams (id, name, abbreviation, conference, division) VALUES (?, ?, ?, ?, ?)",
+            [
+                (1, "Cincinnati Bengals", "CIN", "AFC", "North"),
+                (2, "Buffalo Bills", "BUF", "AFC", "East"),
+            ],
+        )
+        connection.execute(
+            "INSERT INTO games (id, week, home_team_id, away_team_id) VALUES (1, 5, 1, 2)"
+        )
+        connection.commit()
+    monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
+    return db_path
+
+
+def test_main_maps_teams_by_abbreviation_on_existing_database(
+    existing_db_path: Path,
+) -> None:
+    load_data.main()
+
+    with closing(sqlite3.connect(existing_db_path)) as connection:
+        abbreviation = connection.execute(
+            """
+            SELECT teams.abbreviation
+            FROM players JOIN teams ON teams.id = players.team_id
+            WHERE players.name = 'Josh Allen'
+            """
+        ).fetchone()
+        week_one = connection.execute(
+            """
+            SELECT home.abbreviation, away.abbreviation
+            FROM games
+            JOIN teams AS home ON home.id = games.home_team_id
+            JOIN teams AS away ON away.id = games.away_team_id
+            WHERE games.week = 1
+            """
+        ).fetchall()
+    assert abbreviation == ("BUF",)
+    assert week_one == [("BUF", "CIN")]
+
+
+def test_main_keeps_new_games_on_existing_database(existing_db_path: Path) -> None:
+    scheduled = load_data.parse_schedule(load_data._resolve_data_file("schedule"))
+
+    load_data.main()
+
+    with closing(sqlite3.connect(existing_db_path)) as connection:
+        weeks = connection.execute("SELECT week FROM games ORDER BY week").fetchall()
+    # The existing week 5 game plus every scheduled fixture.
+    assert weeks == sorted([(5,)] + [(game["week"],) for game in scheduled])
+
+
+def test_main_copies_by_column_name_into_legacy_table(
+    tmp_path: Path, monkeypatch
+) -> None:
+    # Older databases were created with injury_status before free_agent_year.
+    legacy_schema = load_data.SCHEMA_PATH.read_text().replace(
+        "    free_agent_year INTEGER,\n    injury_status TEXT DEFAULT 'healthy',\n",
+        "    injury_status TEXT DEFAULT 'healthy',\n    free_agent_year INTEGER,\n",
+    )
+    db_path = tmp_path / "legacy.db"
+    with closing(sqlite3.connect(db_path)) as connection:
+        connection.executescript(legacy_schema)
+    monkeypatch.setenv("NFL_GM_DB_PATH", str(db_path))
+
+    load_data.main()
+
+    with closing(sqlite3.connect(db_path)) as connection:
+        agents = connection.execute(
+            "SELECT free_agent_year, injury_status FROM players WHERE status = 'free_agent'"
+        ).fetchall()
+    assert agents
+    assert set(agents) == {(load_data.CURRENT_YEAR, "healthy")}
+
+
+def test_load_schedule_ignores_duplicate_games(staging_connection) -> None:
+    games = [
+        {"week": 1, "home_abbr": "BUF", "away_abbr": "CIN"},
+        {"week": 1, "home_abbr": "BUF", "away_abbr": "CIN"},
+        {"week": 2, "home_abbr": "CIN", "away_abbr": "BUF"},
+    ]
+
+    load_data.load_schedule(staging_connection, games=games)
+
+    rows = staging_connection.execute("SELECT week FROM games ORDER BY week").fetchall()
+    assert rows == [(1,), (2,)]
+
+
+def test_apply_depth_chart_keeps_last_entry_per_player(staging_connection) -> None:
+    staging_connection.execute(
+        "INSERT INTO players (id, name, position, overall_rating) VALUES (1, 'Josh Allen', 'QB', 96)"
+    )
+
+    load_data.apply_depth_chart(
+        staging_connection,
+        depth_entries=[
+            {"team_abbr": "BUF", "position": "QB", "player_id": 1, "order": 1},
+            {"team_abbr": "BUF", "position": "QB", "player_id": 1, "order": 2},
+        ],
+    )
+
+    row = staging_connection.execute(
+        "SELECT depth_chart_position, depth_chart_order FROM players WHERE id = 1"
+    ).fetchone()
+    assert row == ("QB2", 2)
+
+
+def test_load_players_resets_former_free_agent(staging_connection) -> None:
+    staging_connection.execute(
+        """
+        INSERT INTO players (
+            id, name, position, overall_rating, status, free_agent_year,
+            depth_chart_position, depth_chart_order, ovr, spd
+        )
+        VALUES (1, 'Josh Allen', 'QB', 90, 'free_agent', 2025, 'QB1', 1, 88, 80)
+        """
+    )
+    players = [
+        {"id": 1, "name": "Josh Allen", "position": "QB", "overall_rating": 96, "team_abbr": "BUF", "age": 28},
+    ]
+
+    load_data.load_players(
+        staging_connection, rules=load_data.load_game_rules(), players=players
+    )
+
+    row = staging_connection.execute(
+        """
+        SELECT status, free_agent_year, depth_chart_position, depth_chart_order, ovr, spd
+        FROM players WHERE id = 1
+        """
+    ).fetchone()
+    assert row == ("active", None, None, None, 60, None)
+
+
+def test_load_free_agents_resets_rated_player(staging_connection) -> None:
+    staging_connection.execute(
+        """
+        INSERT INTO players (
+            id, name, position, overall_rating, team_id, depth_chart_position, ovr, spd
+        )
+        VALUES (9001, 'Julio Jones', 'WR', 90, 1, 'WR1', 88, 80)
+        """
+    )
+    agents = [
+        {"id": 9001, "name": "Julio Jones", "position": "WR", "overall_rating": 88, "age": 36},
+    ]
+
+    load_data.load_free_agents(
+        staging_connection, rules=load_data.load_game_rules(), year=2025, agents=agents
+    )
+
+    row = staging_connection.execute(
+        """
+        SELECT status, team_id, free_agent_year, depth_chart_position, ovr, spd
+        FROM players WHERE id = 9001
+        """
+    ).fetchone()
+    assert row == ("free_agent", None, 2025, None, 60, None)
@@ -3,12 +3,10 @@ from pathlib import Path
 from shared.utils.parsers import parse_ratings
 
 
-def test_parse_ratings_handles_non_ascii(tmp_path: Path) -> None:
-    fixture_src = Path(__file__).parent / "fixtures" / "ratings_non_ascii.txt"
-    fixture_dst = tmp_path / "ratings.txt"
-    fixture_dst.write_bytes(fixture_src.read_bytes())
+def test_parse_ratings_handles_non_ascii() -> None:
+    fixture = Path(__file__).parent / "fixtures" / "ratings_non_ascii.txt"
 
-    players = parse_ratings(fixture_dst)
+    players = parse_ratings(fixture)
 
     assert players == [
         {
@@ -20,3 +18,24 @@ def test_parse_ratings_handles_non_ascii(tmp_path: Path) -> None:
             "age": 29,
         }
     ]
+
+
+def test_parse_ratings_rereads_edited_feed(tmp_path: Path) -> None:
+    feed = tmp_path / "ratings.txt"
+    feed.write_text("1|Josh Allen|QB|94|BUF|28\n", encoding="utf-8")
+    first = parse_ratings(feed)
+    assert parse_ratings(feed) == first
+
+    feed.write_text("1|Josh Allen|QB|96|BUF|28\n2|James Cook|RB|84|BUF|25\n", encoding="utf-8")
+
+    updated = parse_ratings(feed)
+    assert [player["overall_rating"] for player in updated] == [96, 84]
+
+
+def test_parse_ratings_handles_cr_only_line_endings(tmp_path: Path) -> None:
+    feed = tmp_path / "ratings.txt"
+    feed.write_bytes(b"# id|name|pos|ovr|team|age\r1|Josh Allen|QB|96|BUF|28\r2|James Cook|RB|84|BUF|25\r")
+
+    players = parse_ratings(feed)
+
+    assert [player["name"] for player in players] == ["Josh Allen", "James Cook"]
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from shared.utils.rules import load_game_rules
+
+
+def test_load_game_rules_rereads_edited_file(tmp_path: Path) -> None:
+    rules_file = tmp_path / "GameRules.txt"
+    rules_file.write_text("roster_max=53\n", encoding="utf-8")
+    first = load_game_rules(rules_file)
+    assert load_game_rules(rules_file) is first
+
+    rules_file.write_text("roster_max=55\nmin_position_depth=QB:2\n", encoding="utf-8")
+
+    updated = load_game_rules(rules_file)
+    assert updated.roster_max == 55
+    assert dict(updated.min_position_depth) == {"QB": 2}
+
+
+def test_load_game_rules_handles_cr_only_line_endings(tmp_path: Path) -> None:
+    rules_file = tmp_path / "GameRules.txt"
+    rules_file.write_bytes(b"roster_max=60\rroster_min=40\rmin_position_depth=QB:2\r")
+
+    rules = load_game_rules(rules_file)
+
+    assert (rules.roster_max, rules.roster_min) == (60, 40)
+    assert dict(rules.min_position_depth) == {"QB": 2}